@@ -3,7 +3,13 @@ from datetime import date
 from datetime import timedelta
 import logging
 import asyncio
+import random
+import time
 from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import partial
+from typing import Any
 
 from garminconnect import (
     Garmin,
@@ -11,35 +17,76 @@ from garminconnect import (
     GarminConnectConnectionError,
     GarminConnectTooManyRequestsError,
 )
+from garth.exc import GarthHTTPError
+import requests
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady, IntegrationError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    ACTIVITY_TYPES_CACHE_TTL,
+    API_TIMEOUT,
+    CONNECTION_POOL_SIZE,
     DATA_COORDINATOR,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     GEAR,
+    GEAR_CACHE_TTL,
+    LOGIN_VALID_FOR,
+    MAX_CONCURRENT_REQUESTS,
     SERVICE_SETTING,
+    TOKEN_STORAGE_VERSION,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor"]
 
+# Set when an API call of the current update or service call timed out.
+# Each operation starts with a fresh event, so a timeout in one of them
+# does not make the API calls of another one fail.
+_TIMED_OUT: ContextVar[asyncio.Event | None] = ContextVar(
+    f"{DOMAIN}_timed_out", default=None
+)
+
+# add_body_composition arguments after the timestamp, named as in the service schema
+_BODY_COMPOSITION_FIELDS = (
+    "weight",
+    "percent_fat",
+    "percent_hydration",
+    "visceral_fat_mass",
+    "bone_mass",
+    "muscle_mass",
+    "basal_met",
+    "active_met",
+    "physique_rating",
+    "metabolic_age",
+    "visceral_fat_rating",
+    "bmi",
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Garmin Connect from a config entry."""
 
     coordinator = GarminConnectDataUpdateCoordinator(hass, entry=entry)
 
-    if not await coordinator.async_login():
-        return False
+    try:
+        if not await coordinator.async_login():
+            await coordinator.async_shutdown()
+            return False
 
-    await coordinator.async_config_entry_first_refresh()
+        await coordinator.async_config_entry_first_refresh()
+    except GarminConnectConnectionError as err:
+        await coordinator.async_shutdown()
+        raise ConfigEntryNotReady from err
+    except Exception:
+        await coordinator.async_shutdown()
+        raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {DATA_COORDINATOR: coordinator}
@@ -53,10 +100,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        await hass.data[DOMAIN].pop(entry.entry_id)[DATA_COORDINATOR].async_shutdown()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored Garmin Connect session of a config entry."""
+    await _token_store(hass, entry).async_remove()
+
+
+def _http_status(err: GarthHTTPError) -> int | None:
+    """Return the HTTP status code of a failed garth request."""
+    return getattr(err.error.response, "status_code", None)
+
+
+def _is_transient_error(err: Exception) -> bool:
+    """Return whether a failed request is worth retrying."""
+    if isinstance(err, GarthHTTPError):
+        status = _http_status(err)
+        return status is not None and (status == 429 or status >= 500)
+    return True
+
+
+def _token_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the Garmin Connect session tokens."""
+    return Store(hass, TOKEN_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.tokens")
+
+
 class GarminConnectDataUpdateCoordinator(DataUpdateCoordinator):
     """Garmin Connect Data Update Coordinator."""
 
@@ -71,15 +141,35 @@ class GarminConnectDataUpdateCoordinator(DataUpdateCoordinator):
             self.in_china = True
 
         self._api = Garmin(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD], self.in_china)
+        self._api.garth.configure(
+            pool_connections=CONNECTION_POOL_SIZE, pool_maxsize=CONNECTION_POOL_SIZE
+        )
+        self._api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix=DOMAIN
+        )
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._cache_generation: dict[str, int] = {}
+        self._token_store = _token_store(hass, entry)
+        self._activity_type_index: dict[str, int] = {}
+        self._last_login_ts = 0.0
+        self._needs_relogin = True
+        self._userprofile_id: int | None = None
 
         super().__init__(
             hass, _LOGGER, name=DOMAIN, update_interval=DEFAULT_UPDATE_INTERVAL
         )
 
     async def async_login(self) -> bool:
-        """Login to Garmin Connect."""
+        """Login to Garmin Connect.
+
+        Connection errors are raised, so callers can report them in the
+        way their context expects.
+        """
+        self._needs_relogin = True
         try:
-            await self.hass.async_add_executor_job(self._api.login)
+            if not await self._async_resume_session():
+                await self._async_run_in_executor(self._api.login)
         except (
             GarminConnectAuthenticationError,
             GarminConnectTooManyRequestsError,
@@ -90,21 +180,219 @@ class GarminConnectDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error(
                 "Connection error occurred during Garmin Connect login request: %s", err
             )
-            raise ConfigEntryNotReady from err
+            raise
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception(
                 "Unknown error occurred during Garmin Connect login request"
             )
             return False
 
+        self._last_login_ts = time.monotonic()
+        self._needs_relogin = False
+        await self._token_store.async_save({"tokens": self._api.garth.dumps()})
+        return True
+
+    async def _async_ensure_session(self) -> None:
+        """Login again only when the current session may have expired."""
+        if (
+            not self._needs_relogin
+            and time.monotonic() - self._last_login_ts < LOGIN_VALID_FOR.total_seconds()
+        ):
+            return
+
+        try:
+            logged_in = await self.async_login()
+        except GarminConnectConnectionError as err:
+            raise IntegrationError(
+                "Failed to login to Garmin Connect, unable to update"
+            ) from err
+        if not logged_in:
+            raise IntegrationError(
+                "Failed to login to Garmin Connect, unable to update"
+            )
+
+    async def _async_resume_session(self) -> bool:
+        """Resume the session stored by a previous login, if any."""
+        if not (stored := await self._token_store.async_load()):
+            return False
+
+        try:
+            await self._async_run_in_executor(self._api.login, stored["tokens"])
+        except GarthHTTPError as err:
+            if (status := _http_status(err)) in (401, 403):
+                _LOGGER.debug("Stored Garmin Connect session is not usable: %s", err)
+                return False
+            if status == 429:
+                raise GarminConnectTooManyRequestsError(err) from err
+            raise GarminConnectConnectionError(err) from err
+        except requests.exceptions.RequestException as err:
+            raise GarminConnectConnectionError(err) from err
+        except (
+            GarminConnectAuthenticationError,
+            KeyError,
+            OSError,
+            TypeError,
+            ValueError,
+        ) as err:
+            # A short token string is taken for a token directory by
+            # Garmin.login, which then fails with an OSError
+            _LOGGER.debug("Stored Garmin Connect session is not usable: %s", err)
+            return False
+
         return True
 
+    async def async_shutdown(self) -> None:
+        """Stop updates and release the Garmin Connect worker threads."""
+        await super().async_shutdown()
+        self._executor.shutdown(wait=False)
+
+    async def _async_run_in_executor(self, func, *args):
+        """Run a blocking function in the Garmin Connect worker threads."""
+        return await self.hass.loop.run_in_executor(self._executor, func, *args)
+
+    async def _async_api_call(self, func, *args):
+        """Run a blocking Garmin Connect API call in the executor.
+
+        Once a call has timed out, the remaining calls of the same update
+        or service call fail right away.
+        An authentication failure marks the session as stale, so the next
+        service call logs in again.
+        """
+        timed_out = _TIMED_OUT.get()
+        async with self._api_semaphore:
+            if timed_out is not None and timed_out.is_set():
+                raise TimeoutError("Garmin Connect did not respond in time")
+            try:
+                return await asyncio.wait_for(
+                    self._async_run_in_executor(func, *args), API_TIMEOUT
+                )
+            except TimeoutError:
+                if timed_out is not None:
+                    timed_out.set()
+                raise
+            except GarminConnectAuthenticationError:
+                self._needs_relogin = True
+                raise
+            except GarthHTTPError as err:
+                if _http_status(err) == 401:
+                    self._needs_relogin = True
+                raise
+
+    async def _async_cached_api_call(self, key: str, ttl: timedelta, func, *args):
+        """Run an API call, reusing its last result while younger than ttl."""
+        if (cached := self._cache.get(key)) is not None:
+            timestamp, value = cached
+            if time.monotonic() - timestamp < ttl.total_seconds():
+                return value
+
+        generation = self._cache_generation.get(key, 0)
+        value = await self._async_api_call(func, *args)
+        # Don't cache a result fetched before the key was invalidated
+        if self._cache_generation.get(key, 0) == generation:
+            self._cache[key] = (time.monotonic(), value)
+        return value
+
+    def _invalidate_cache(self, key: str) -> None:
+        """Drop a cached result, including one still being fetched."""
+        self._cache.pop(key, None)
+        self._cache_generation[key] = self._cache_generation.get(key, 0) + 1
+
+    async def _async_gather_api_calls(self, *calls: Awaitable) -> list:
+        """Run independent Garmin Connect API calls concurrently.
+
+        Every call is awaited before the first error is raised, so no
+        executor job is left running behind a relogin.
+        """
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _fetch_gear_sync(self, userprofile_id) -> tuple:
+        """Fetch gear and gear defaults in a single executor job."""
+        return (
+            self._api.get_gear(userprofile_id),
+            self._api.get_gear_defaults(userprofile_id),
+        )
+
+    async def _async_fetch_gear(self, userprofile_id) -> tuple:
+        """Fetch gear, gear defaults and the stats of every gear item."""
+        gear, gear_defaults = await self._async_cached_api_call(
+            "gear",
+            GEAR_CACHE_TTL,
+            self._fetch_gear_sync,
+            userprofile_id,
+        )
+        _LOGGER.debug("Gear data: %s", gear)
+        _LOGGER.debug("Gear defaults data: %s", gear_defaults)
+
+        tasks: list[Awaitable] = [
+            self._async_api_call(self._api.get_gear_stats, gear_item[GEAR.UUID])
+            for gear_item in gear
+        ]
+        gear_stats = []
+        for gear_item, result in zip(
+            gear, await asyncio.gather(*tasks, return_exceptions=True)
+        ):
+            if isinstance(result, BaseException):
+                _LOGGER.debug(
+                    "Gear stats for %s are not available: %s",
+                    gear_item[GEAR.UUID],
+                    result,
+                )
+                continue
+            gear_stats.append(result)
+        _LOGGER.debug("Gear stats data: %s", gear_stats)
+
+        return gear, gear_defaults, gear_stats
+
+    async def _async_update_gear(self) -> tuple:
+        """Fetch gear data, retrying once after a connection or rate limit error.
+
+        Gear data is optional, so errors are logged instead of raised and
+        empty gear data is returned.
+        """
+        if self._userprofile_id is None:
+            _LOGGER.debug("Gear data is not available: user profile id unknown")
+            return {}, {}, {}
+
+        try:
+            try:
+                return await self._async_fetch_gear(self._userprofile_id)
+            except (
+                GarminConnectConnectionError,
+                GarminConnectTooManyRequestsError,
+                GarthHTTPError,
+                requests.exceptions.RequestException,
+            ) as err:
+                if not _is_transient_error(err):
+                    raise
+                _LOGGER.debug("Retrying gear data request after error: %s", err)
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+                return await self._async_fetch_gear(self._userprofile_id)
+        except (
+            GarminConnectConnectionError,
+            GarminConnectTooManyRequestsError,
+            GarthHTTPError,
+            requests.exceptions.RequestException,
+            KeyError,
+            TimeoutError,
+        ) as err:
+            _LOGGER.debug("Gear data is not available: %s", err)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Unknown error occurred while fetching Garmin Connect gear data",
+                exc_info=True,
+            )
+        return {}, {}, {}
+
     async def _async_update_data(self) -> dict:
         """Fetch data from Garmin Connect."""
 
         summary = {}
         body = {}
-        activites = {}
+        activities = {}
         alarms = {}
         gear = {}
         gear_stats = {}
@@ -113,75 +401,83 @@ class GarminConnectDataUpdateCoordinator(DataUpdateCoordinator):
         sleep_data = {}
         sleep_score = None
 
-        try:
-            summary = await self.hass.async_add_executor_job(
-                self._api.get_user_summary, date.today().isoformat()
-            )
-            _LOGGER.debug(f"Summary data: {summary}")
-
-            body = await self.hass.async_add_executor_job(
-                self._api.get_body_composition, date.today().isoformat()
-            )
-            _LOGGER.debug(f"Body data: {body}")
+        today = date.today()
+        today_iso = today.isoformat()
+        week_ago_iso = (today - timedelta(days=7)).isoformat()
+        tomorrow_iso = (today + timedelta(days=1)).isoformat()
 
-            activities = await self.hass.async_add_executor_job(
-                self._api.get_activities_by_date, (date.today()-timedelta(days=7)).isoformat(), (date.today()+timedelta(days=1)).isoformat()
+        _TIMED_OUT.set(asyncio.Event())
+        try:
+            # Fetch the summary on its own first, so an expired session is
+            # detected before the remaining requests are sent
+            summary = await self._async_api_call(
+                self._api.get_user_summary, today_iso
             )
-            _LOGGER.debug(f"Activities data: {activities}")
-            summary['lastActivities'] = activities
-
-            alarms = await self.hass.async_add_executor_job(self._api.get_device_alarms)
-            _LOGGER.debug(f"Alarms data: {alarms}")
-
-            activity_types = await self.hass.async_add_executor_job(
-                self._api.get_activity_types
+            _LOGGER.debug("Summary data: %s", summary)
+            if GEAR.USERPROFILE_ID in summary:
+                self._userprofile_id = summary[GEAR.USERPROFILE_ID]
+
+            (
+                (gear, gear_defaults, gear_stats),
+                body,
+                activities,
+                alarms,
+                activity_types,
+                sleep_data,
+            ) = await self._async_gather_api_calls(
+                self._async_update_gear(),
+                self._async_api_call(self._api.get_body_composition, today_iso),
+                self._async_api_call(
+                    self._api.get_activities_by_date, week_ago_iso, tomorrow_iso
+                ),
+                self._async_api_call(self._api.get_device_alarms),
+                self._async_cached_api_call(
+                    "activity_types",
+                    ACTIVITY_TYPES_CACHE_TTL,
+                    self._api.get_activity_types,
+                ),
+                self._async_api_call(self._api.get_sleep_data, today_iso),
             )
-            _LOGGER.debug(f"Activity types data: {activity_types}")
-
-            sleep_data = await self.hass.async_add_executor_job(
-                self._api.get_sleep_data, date.today().isoformat())
-            _LOGGER.debug(f"Sleep data: {sleep_data}")
+            _LOGGER.debug("Body data: %s", body)
+            _LOGGER.debug("Activities data: %s", activities)
+            _LOGGER.debug("Alarms data: %s", alarms)
+            _LOGGER.debug("Activity types data: %s", activity_types)
+            self._activity_type_index = {
+                activity_type[GEAR.TYPE_KEY]: activity_type[GEAR.TYPE_ID]
+                for activity_type in activity_types
+            }
+            _LOGGER.debug("Sleep data: %s", sleep_data)
         except (
             GarminConnectAuthenticationError,
             GarminConnectTooManyRequestsError,
             GarminConnectConnectionError,
+            TimeoutError,
+            GarthHTTPError,
         ) as error:
+            if isinstance(error, GarthHTTPError) and _http_status(error) not in (
+                401,
+                403,
+            ):
+                raise UpdateFailed(error) from error
             _LOGGER.debug("Trying to relogin to Garmin Connect")
-            if not await self.async_login():
+            try:
+                logged_in = await self.async_login()
+            except GarminConnectConnectionError as err:
+                raise UpdateFailed(err) from err
+            if not logged_in:
                 raise UpdateFailed(error) from error
             return {}
+        except requests.exceptions.RequestException as error:
+            raise UpdateFailed(error) from error
 
-        try:
-            gear = await self.hass.async_add_executor_job(
-                self._api.get_gear, summary[GEAR.USERPROFILE_ID]
-            )
-            _LOGGER.debug(f"Gear data: {gear}")
-
-            tasks: list[Awaitable] = [
-                self.hass.async_add_executor_job(
-                    self._api.get_gear_stats, gear_item[GEAR.UUID]
-                )
-                for gear_item in gear
-            ]
-            gear_stats = await asyncio.gather(*tasks)
-            _LOGGER.debug(f"Gear stats data: {gear_stats}")
-
-            gear_defaults = await self.hass.async_add_executor_job(
-                self._api.get_gear_defaults, summary[GEAR.USERPROFILE_ID]
-            )
-            _LOGGER.debug(f"Gear defaults data: {gear_defaults}")
-        except:
-            _LOGGER.debug("Gear data is not available")
+        sleep_dto = (sleep_data or {}).get("dailySleepDTO") or {}
+        sleep_score = (
+            (sleep_dto.get("sleepScores") or {}).get("overall") or {}
+        ).get("value")
+        _LOGGER.debug("Sleep score data: %s", sleep_score)
 
-        try:
-            sleep_score = sleep_data["dailySleepDTO"]["sleepScores"]["overall"]["value"]
-            _LOGGER.debug(f"Sleep score data: {sleep_score}")
-        except KeyError:
-            _LOGGER.debug("Sleep score data is not available")
-
-        return {
-            **summary,
-            **body["totalAverage"],
+        return summary | body["totalAverage"] | {
+            "lastActivities": activities,
             "nextAlarm": alarms,
             "gear": gear,
             "gear_stats": gear_stats,
@@ -192,68 +488,81 @@ class GarminConnectDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def set_active_gear(self, entity, service_data):
         """Update Garmin Gear settings"""
-        if not await self.async_login():
-            raise IntegrationError(
-                "Failed to login to Garmin Connect, unable to update"
-            )
+        _TIMED_OUT.set(asyncio.Event())
+        await self._async_ensure_session()
 
         setting = service_data.data["setting"]
-        activity_type_id = next(
-            filter(
-                lambda a: a[GEAR.TYPE_KEY] == service_data.data["activity_type"],
-                self.data["activity_types"],
-            )
-        )[GEAR.TYPE_ID]
+        activity_type = service_data.data["activity_type"]
+        if (activity_type_id := self._activity_type_index.get(activity_type)) is None:
+            raise IntegrationError(f"Unknown activity type: {activity_type}")
         if setting != SERVICE_SETTING.ONLY_THIS_AS_DEFAULT:
-            await self.hass.async_add_executor_job(
+            await self._async_api_call(
                 self._api.set_gear_default,
                 activity_type_id,
                 entity.uuid,
                 setting == SERVICE_SETTING.DEFAULT,
             )
         else:
-            old_default_state = await self.hass.async_add_executor_job(
-                self._api.get_gear_defaults, self.data[GEAR.USERPROFILE_ID]
+            if self._userprofile_id is None:
+                raise IntegrationError("User profile id unknown")
+            old_default_state = await self._async_api_call(
+                self._api.get_gear_defaults, self._userprofile_id
             )
-            to_deactivate = list(
-                filter(
-                    lambda o: o[GEAR.ACTIVITY_TYPE_PK] == activity_type_id
-                    and o[GEAR.UUID] != entity.uuid,
-                    old_default_state,
-                )
+            to_deactivate = (
+                old_default
+                for old_default in old_default_state
+                if old_default[GEAR.ACTIVITY_TYPE_PK] == activity_type_id
+                and old_default[GEAR.UUID] != entity.uuid
             )
 
-            for active_gear in to_deactivate:
-                await self.hass.async_add_executor_job(
-                    self._api.set_gear_default,
-                    activity_type_id,
-                    active_gear[GEAR.UUID],
-                    False,
-                )
-            await self.hass.async_add_executor_job(
+            # Set the new default before unsetting the others, so a failure
+            # never leaves the activity type without default gear
+            await self._async_api_call(
                 self._api.set_gear_default, activity_type_id, entity.uuid, True
             )
+            try:
+                await self._async_gather_api_calls(
+                    *(
+                        self._async_api_call(
+                            self._api.set_gear_default,
+                            activity_type_id,
+                            active_gear[GEAR.UUID],
+                            False,
+                        )
+                        for active_gear in to_deactivate
+                    )
+                )
+            except Exception as err:
+                self._invalidate_cache("gear")
+                raise IntegrationError(
+                    f"Gear was set as default for {activity_type}, but other "
+                    f"default gear may still be set: {err}"
+                ) from err
+
+        # Gear defaults changed, make the next update fetch them again
+        self._invalidate_cache("gear")
 
     async def add_body_composition(self, entity, service_data):
         """Record a weigh in/body composition"""
-        if not await self.async_login():
-            raise IntegrationError(
-                "Failed to login to Garmin Connect, unable to update"
-            )
+        _TIMED_OUT.set(asyncio.Event())
+        await self._async_ensure_session()
 
-        await self.hass.async_add_executor_job(
-            self._api.add_body_composition,
-                    service_data.data.get("timestamp", None),
-                    service_data.data.get("weight"),
-                    service_data.data.get("percent_fat", None),
-                    service_data.data.get("percent_hydration", None),
-                    service_data.data.get("visceral_fat_mass", None),
-                    service_data.data.get("bone_mass", None),
-                    service_data.data.get("muscle_mass", None),
-                    service_data.data.get("basal_met", None),
-                    service_data.data.get("active_met", None),
-                    service_data.data.get("physique_rating", None),
-                    service_data.data.get("metabolic_age", None),
-                    service_data.data.get("visceral_fat_rating", None),
-                    service_data.data.get("bmi", None)
-        )
+        try:
+            await self._async_api_call(
+                partial(
+                    self._api.add_body_composition,
+                    service_data.data.get("timestamp"),
+                    **{
+                        field: service_data.data[field]
+                        for field in _BODY_COMPOSITION_FIELDS
+                        if field in service_data.data
+                    },
+                )
+            )
+        except TimeoutError as err:
+            # The upload keeps running in its worker thread, retrying could
+            # record the weigh in twice
+            raise IntegrationError(
+                "Garmin Connect did not respond in time, the body composition "
+                "may or may not have been recorded"
+            ) from err
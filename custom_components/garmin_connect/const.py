@@ -16,6 +16,15 @@ from homeassistant.components.sensor import (
 DOMAIN = "garmin_connect"
 DATA_COORDINATOR = "coordinator"
 DEFAULT_UPDATE_INTERVAL = timedelta(minutes=5)
+TOKEN_STORAGE_VERSION = 1
+LOGIN_VALID_FOR = timedelta(hours=1)
+MAX_CONCURRENT_REQUESTS = 5
+CONNECTION_POOL_SIZE = 20
+# Above garth's own envelope of a 10 second timeout per attempt with up to
+# 3 retries and backoff, so only requests garth itself gave up on time out
+API_TIMEOUT = 60
+ACTIVITY_TYPES_CACHE_TTL = timedelta(hours=24)
+GEAR_CACHE_TTL = timedelta(hours=1)
 
 GARMIN_ENTITY_LIST = {
     "totalSteps": ["Total Steps", "steps", "mdi:walk", None, SensorStateClass.TOTAL, True],